@@ -6,7 +6,7 @@ echo "================================================"
 
 # Check Python 3
 if ! command -v python3 &> /dev/null; then
-    echo "❌ Python 3 is not installed. Please install Python 3.8 or later."
+    echo "❌ Python 3 is not installed. Please install Python 3.10 or later."
     exit 1
 fi
 
@@ -3,6 +3,9 @@ Configuration for Real-Time Photon Animation Demo
 Simple, educational visualization of photon propagation
 """
 
+from types import MappingProxyType
+from typing import NamedTuple, Tuple
+
 # Window dimensions
 WINDOW_WIDTH = 1400
 WINDOW_HEIGHT = 800
@@ -30,6 +33,10 @@ ABSORB_PLOT_Y = ANIM_MARGIN
 ABSORB_PLOT_WIDTH = SCENE_WIDTH - ABSORB_PLOT_X - 20
 ABSORB_PLOT_HEIGHT = ANIM_HEIGHT
 
+# Space around plot frames for the title above and max label below
+PLOT_TITLE_SPACE = 40
+PLOT_LABEL_SPACE = 25
+
 # Colors
 COLOR_BG = (240, 245, 250)
 COLOR_PANEL = (255, 255, 255)
@@ -47,7 +54,7 @@ COLOR_SCATTER_EVENT = (255, 100, 255)  # Magenta flash for scattering
 PHOTON_RADIUS = 3
 PHOTON_SPEED = 2.0  # Pixels per frame (in optical depth units)
 SCATTER_FLASH_DURATION = 20  # Frames to show scatter event flash
-ABSORPTION_FADE_DURATION = 25  # Frames for absorption animation
+ABSORPTION_FADE_DURATION = 15  # Frames for absorption animation
 
 # Simulation parameters
 DEFAULT_TAU_MAX = 3.0
@@ -69,9 +76,22 @@ WEIGHT_THRESHOLD = 0.01
 # Frame rate
 FPS = 60
 
+# Simulation steps run at FPS in real time; a slow frame catches up by at most this many
+MAX_STEPS_PER_FRAME = 4
+
+# Layer slider changes are applied once the slider has been idle this long
+SLIDER_DEBOUNCE_MS = 250
+
 # Statistics bins
 NUM_DEPTH_BINS = 25  # For showing where photons are absorbed/scattered
 
+# Rendered text surfaces kept for reuse across frames
+TEXT_CACHE_SIZE = 256
+
+# Info box text
+INFO_FONT_SIZE = 18
+INFO_SEGMENT_GAP = 12
+
 # Counter display
 COUNTER_FONT_SIZE = 48
 COUNTER_LABEL_SIZE = 20
@@ -85,6 +105,17 @@ FLUX_LABEL_SIZE = 18
 MAX_LAYERS = 5
 MIN_LAYERS = 1
 
+
+class LayerPreset(NamedTuple):
+    """Optical properties and display settings of a layer preset"""
+
+    tau_thickness: float
+    omega_0: float
+    g: float
+    description: str
+    color: Tuple[int, int, int, int]  # RGBA fill for the layer
+
+
 # Layer presets with literature-based optical properties
 # References:
 # - Rayleigh: g=0 (symmetric), ω=1.0 (pure scattering), τ~0.08 at 500nm
@@ -94,60 +125,63 @@ MIN_LAYERS = 1
 # - Volcanic sulfate: τ~0.0-0.3, ω~0.98 (highly reflective)
 # - Biomass smoke: τ~0.23, ω~0.87, g~0.60
 LAYER_PRESETS = {
-    "Rayleigh (Clear Sky)": {
-        "tau_thickness": 0.08,
-        "omega_0": 1.0,
-        "g": 0.0,
-        "description": "Molecular scattering only",
-        "color": (135, 206, 250, 60),  # Light blue
-    },
-    "Cirrus (Ice Cloud)": {
-        "tau_thickness": 0.8,
-        "omega_0": 0.92,
-        "g": 0.75,
-        "description": "High-altitude ice crystals",
-        "color": (240, 248, 255, 90),  # Alice blue
-    },
-    "Stratocumulus (Water)": {
-        "tau_thickness": 10.0,
-        "omega_0": 0.9999,
-        "g": 0.85,
-        "description": "Low-level water cloud",
-        "color": (220, 220, 220, 130),  # Light gray
-    },
-    "Altostratus (Water)": {
-        "tau_thickness": 5.0,
-        "omega_0": 0.9995,
-        "g": 0.85,
-        "description": "Mid-level water cloud",
-        "color": (200, 200, 210, 110),  # Light gray-blue
-    },
-    "Urban Aerosol": {
-        "tau_thickness": 0.15,
-        "omega_0": 0.835,
-        "g": 0.39,
-        "description": "Pollution and urban haze",
-        "color": (205, 170, 125, 110),  # Tan/brown
-    },
-    "Volcanic Sulfate": {
-        "tau_thickness": 0.10,
-        "omega_0": 0.98,
-        "g": 0.65,
-        "description": "Stratospheric sulfate layer",
-        "color": (190, 190, 200, 100),  # Light gray-white
-    },
-    "Biomass Smoke": {
-        "tau_thickness": 0.23,
-        "omega_0": 0.87,
-        "g": 0.60,
-        "description": "Wildfire/agricultural smoke",
-        "color": (139, 137, 137, 140),  # Dark gray
-    },
-    "Custom": {
-        "tau_thickness": 1.0,
-        "omega_0": 0.9,
-        "g": 0.0,
-        "description": "User-defined properties",
-        "color": (135, 206, 235, 80),  # Sky blue
-    },
+    "Rayleigh (Clear Sky)": LayerPreset(
+        tau_thickness=0.08,
+        omega_0=1.0,
+        g=0.0,
+        description="Molecular scattering only",
+        color=(135, 206, 250, 60),  # Light blue
+    ),
+    "Cirrus (Ice Cloud)": LayerPreset(
+        tau_thickness=0.8,
+        omega_0=0.92,
+        g=0.75,
+        description="High-altitude ice crystals",
+        color=(240, 248, 255, 90),  # Alice blue
+    ),
+    "Stratocumulus (Water)": LayerPreset(
+        tau_thickness=10.0,
+        omega_0=0.9999,
+        g=0.85,
+        description="Low-level water cloud",
+        color=(220, 220, 220, 130),  # Light gray
+    ),
+    "Altostratus (Water)": LayerPreset(
+        tau_thickness=5.0,
+        omega_0=0.9995,
+        g=0.85,
+        description="Mid-level water cloud",
+        color=(200, 200, 210, 110),  # Light gray-blue
+    ),
+    "Urban Aerosol": LayerPreset(
+        tau_thickness=0.15,
+        omega_0=0.835,
+        g=0.39,
+        description="Pollution and urban haze",
+        color=(205, 170, 125, 110),  # Tan/brown
+    ),
+    "Volcanic Sulfate": LayerPreset(
+        tau_thickness=0.10,
+        omega_0=0.98,
+        g=0.65,
+        description="Stratospheric sulfate layer",
+        color=(190, 190, 200, 100),  # Light gray-white
+    ),
+    "Biomass Smoke": LayerPreset(
+        tau_thickness=0.23,
+        omega_0=0.87,
+        g=0.60,
+        description="Wildfire/agricultural smoke",
+        color=(139, 137, 137, 140),  # Dark gray
+    ),
+    "Custom": LayerPreset(
+        tau_thickness=1.0,
+        omega_0=0.9,
+        g=0.0,
+        description="User-defined properties",
+        color=(135, 206, 235, 80),  # Sky blue
+    ),
 }
+
+# Read-only view: layers copy values out of presets, nothing should edit them
+LAYER_PRESETS = MappingProxyType(LAYER_PRESETS)
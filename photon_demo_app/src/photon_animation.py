@@ -5,14 +5,15 @@ Supports multi-layer atmospheres with different optical properties per layer
 """
 
 import numpy as np
-from dataclasses import dataclass, field
+from bisect import bisect_left
+from dataclasses import dataclass, field, fields
 from typing import List, Tuple, Optional
-from enum import Enum
+from enum import IntEnum
 
-from config import NUM_DEPTH_BINS
+from config import ABSORPTION_FADE_DURATION, NUM_DEPTH_BINS
 
 
-@dataclass
+@dataclass(slots=True)
 class AtmosphericLayer:
     """
     Defines a single atmospheric layer with optical properties
@@ -45,8 +46,8 @@ class AtmosphericLayer:
         self.tau_bottom = tau_top + self.tau_thickness
 
 
-class PhotonState(Enum):
-    """Current state of animated photon"""
+class PhotonState(IntEnum):
+    """Current state of animated photon (finished states sort after visible ones)"""
 
     MOVING = 1
     SCATTERING = 2  # Flash animation
@@ -56,49 +57,25 @@ class PhotonState(Enum):
     ABSORBED = 6  # Fully absorbed
 
 
-class Direction(Enum):
+class Direction(IntEnum):
     """Movement direction"""
 
     DOWN = 1
     UP = -1
 
 
-@dataclass
-class AnimatedPhoton:
-    """
-    A photon with animation state for real-time visualization
-
-    Attributes:
-        tau: Current optical depth position [0, tau_max]
-        direction: Direction.DOWN or Direction.UP
-        weight: Current weight [0, 1]
-        state: Current animation state
-        x_position: Horizontal position for display (fixed, just for spreading out visually)
-        next_interaction_tau: Optical depth where next interaction occurs
-        scatter_flash_timer: Frames remaining for scatter flash
-        absorption_timer: Frames remaining for absorption fade
-    """
-
-    tau: float = 0.0
-    direction: Direction = Direction.DOWN
-    weight: float = 1.0
-    state: PhotonState = PhotonState.MOVING
-    x_position: float = 0.0
-    next_interaction_tau: float = 0.0
-    scatter_flash_timer: int = 0
-    absorption_timer: int = 0
-
-    def __post_init__(self):
-        """Sample first interaction on creation"""
-        if self.next_interaction_tau == 0.0:
-            self.next_interaction_tau = self._sample_next_interaction()
+# Plain int codes stored in the photon arrays (avoids enum lookups in the step)
+_MOVING = PhotonState.MOVING.value
+_SCATTERING = PhotonState.SCATTERING.value
+_ABSORBING = PhotonState.ABSORBING.value
+_REFLECTED = PhotonState.REFLECTED.value
+_TRANSMITTED = PhotonState.TRANSMITTED.value
+_ABSORBED = PhotonState.ABSORBED.value
+_DOWN = Direction.DOWN.value
+_UP = Direction.UP.value
 
-    def _sample_next_interaction(self) -> float:
-        """Sample optical depth to next interaction"""
-        return -np.log(np.random.random())
 
-
-@dataclass
+@dataclass(slots=True)
 class SimulationStats:
     """Statistics tracker for the simulation"""
 
@@ -108,10 +85,14 @@ class SimulationStats:
     absorbed: int = 0
 
     # Where photons get absorbed (depth bins)
-    absorption_profile: List[int] = field(default_factory=lambda: [0] * NUM_DEPTH_BINS)
+    absorption_profile: np.ndarray = field(
+        default_factory=lambda: np.zeros(NUM_DEPTH_BINS, dtype=np.int64)
+    )
 
     # Where photons scatter (depth bins)
-    scattering_profile: List[int] = field(default_factory=lambda: [0] * NUM_DEPTH_BINS)
+    scattering_profile: np.ndarray = field(
+        default_factory=lambda: np.zeros(NUM_DEPTH_BINS, dtype=np.int64)
+    )
 
     # Running counts of photons in each state
     currently_moving: int = 0
@@ -125,8 +106,8 @@ class SimulationStats:
         self.reflected = 0
         self.transmitted = 0
         self.absorbed = 0
-        self.absorption_profile = [0] * len(self.absorption_profile)
-        self.scattering_profile = [0] * len(self.scattering_profile)
+        self.absorption_profile.fill(0)
+        self.scattering_profile.fill(0)
         self.currently_moving = 0
         self.total_scatters = 0
 
@@ -153,6 +134,52 @@ class SimulationStats:
         return self.absorbed / self.total_launched if self.total_launched > 0 else 0.0
 
 
+@dataclass(slots=True)
+class PhotonArrays:
+    """
+    Structure-of-arrays storage for every photon in a simulation run
+
+    Index i holds the state of the i-th launched photon, so the whole batch
+    can be advanced with NumPy mask operations instead of a Python loop.
+
+    Attributes:
+        tau: Current optical depth position
+        direction: Direction value (+1 down, -1 up)
+        weight: Current weight [0, 1]
+        state: PhotonState value
+        x_position: Horizontal display position
+        next_interaction_tau: Optical depth where next interaction occurs
+        absorption_timer: Frames remaining for absorption fade
+    """
+
+    tau: np.ndarray
+    direction: np.ndarray
+    weight: np.ndarray
+    state: np.ndarray
+    x_position: np.ndarray
+    next_interaction_tau: np.ndarray
+    absorption_timer: np.ndarray
+
+    @classmethod
+    def allocate(cls, capacity: int) -> "PhotonArrays":
+        """Allocate storage for up to capacity photons"""
+        return cls(
+            tau=np.zeros(capacity),
+            direction=np.full(capacity, _DOWN, dtype=np.int8),
+            weight=np.ones(capacity),
+            state=np.full(capacity, _MOVING, dtype=np.int8),
+            x_position=np.zeros(capacity),
+            next_interaction_tau=np.zeros(capacity),
+            absorption_timer=np.zeros(capacity, dtype=np.int32),
+        )
+
+    def take(self, idx: np.ndarray) -> "PhotonArrays":
+        """Copy out the photons at idx"""
+        return PhotonArrays(
+            **{f.name: getattr(self, f.name)[idx] for f in fields(self)}
+        )
+
+
 class PhotonSimulation:
     """
     Manages real-time animated photon simulation
@@ -167,6 +194,7 @@ class PhotonSimulation:
         scene_width: float,
         mode: str = "sequential",
         weight_threshold: float = 0.01,
+        seed: Optional[int] = None,
     ):
         self.layers = layers
         self.surface_albedo = surface_albedo
@@ -175,34 +203,70 @@ class PhotonSimulation:
         self.mode = mode  # "sequential" or "parallel"
         self.weight_threshold = weight_threshold
 
-        self.photons: List[AnimatedPhoton] = []
+        # PCG64 generator; faster than the legacy global Mersenne Twister.
+        # Pass a seed for reproducible runs
+        self._rng = np.random.default_rng(seed)
+
+        self.photons = self._allocate_photons(num_photons)
         self.stats = SimulationStats()
 
         self.launch_counter = 0
         self.launch_interval = 2  # Frames between photon launches (sequential mode)
         self.frames_since_launch = 0
 
+        # Compacted indices of launched photons that have not finished yet,
+        # covering launches up to _alive_end
+        self._alive = np.empty(0, dtype=np.intp)
+        self._alive_end = 0
+
         # Calculate layer boundaries from tau_thickness
         self._update_layer_boundaries()
 
     def _update_layer_boundaries(self):
-        """Calculate tau_top and tau_bottom for all layers based on tau_thickness"""
+        """
+        Calculate tau_top and tau_bottom for all layers based on tau_thickness
+        and refresh the per-layer property tables used by the interaction step
+
+        Must be called whenever a layer's thickness, omega_0 or g changes.
+        """
         tau_top = 0.0
         for layer in self.layers:
             layer.update_boundaries(tau_top)
             tau_top = layer.tau_bottom
 
+        self._layer_bottoms = np.array([layer.tau_bottom for layer in self.layers])
+        self._tau_max = self.layers[-1].tau_bottom if self.layers else 0.0
+        self._inv_tau_max = 1.0 / self._tau_max if self._tau_max > 0 else 0.0
+        self._layer_omega_0 = np.array([layer.omega_0 for layer in self.layers])
+        # Henyey-Greenstein in 2-stream: P(forward) = (1 + g) / 2. Scaled by omega_0
+        # it is the split point of the single uniform drawn per interaction
+        self._layer_forward_threshold = (
+            self._layer_omega_0 * (1 + np.array([layer.g for layer in self.layers])) / 2
+        )
+
+        # Single-scattering albedo regimes with a cheaper interaction step
+        self._conservative = bool(np.all(self._layer_omega_0 == 1.0))
+        self._pure_absorption = bool(np.all(self._layer_omega_0 == 0.0))
+
+    def _allocate_photons(self, num_photons: int) -> PhotonArrays:
+        """Allocate photon storage with first interaction depths pre-sampled"""
+        photons = PhotonArrays.allocate(num_photons)
+        # One batched draw for the whole run instead of one call per launch
+        photons.next_interaction_tau[:] = self._rng.standard_exponential(num_photons)
+        return photons
+
     @property
     def tau_max(self) -> float:
-        """Total optical depth of all layers"""
-        return self.layers[-1].tau_bottom if self.layers else 0.0
+        """Total optical depth of all layers, as of the last boundary update"""
+        return self._tau_max
 
     def get_layer_at_tau(self, tau: float) -> Optional[AtmosphericLayer]:
         """Find which layer contains the given optical depth"""
-        for layer in self.layers:
-            if layer.contains_tau(tau):
-                return layer
-        return None
+        if not self.layers or not 0.0 <= tau <= self._tau_max:
+            return None
+        # Binary search of the cached bottoms; a boundary belongs to the upper layer
+        i = bisect_left(self._layer_bottoms, tau)
+        return self.layers[min(i, len(self.layers) - 1)]
 
     def reset(
         self,
@@ -217,23 +281,27 @@ class PhotonSimulation:
         self.num_photons = num_photons
         self.mode = mode
 
-        self.photons.clear()
+        self.photons = self._allocate_photons(num_photons)
         self.stats.reset()
         self.launch_counter = 0
         self.frames_since_launch = 0
+        self._alive = np.empty(0, dtype=np.intp)
+        self._alive_end = 0
 
         # Calculate layer boundaries from tau_thickness
         self._update_layer_boundaries()
 
         # In parallel mode, launch all photons at once
         if self.mode == "parallel":
-            for i in range(self.num_photons):
-                self._launch_photon()
+            self._launch_photons(self.num_photons)
 
     def update(self, speed: float = 2.0):
         """
         Update simulation by one time step
 
+        All launched photons are advanced together using vectorized
+        operations on the photon arrays.
+
         Args:
             speed: Movement speed in optical depth units per frame
         """
@@ -244,160 +312,192 @@ class PhotonSimulation:
                 self._launch_photon()
                 self.frames_since_launch = 0
 
-        # Update all active photons
-        for photon in self.photons:
-            self._update_photon(photon, speed)
+        alive = self._alive_indices()
+        state = self.photons.state[alive]
+
+        # Absorbing photons finish their fade animation before being counted
+        self._update_absorbing(alive[state == _ABSORBING])
 
-        # Remove completed photons (keep for a bit for visualization)
-        self.photons = [
-            p
-            for p in self.photons
-            if p.state not in [PhotonState.REFLECTED, PhotonState.TRANSMITTED]
-            or p.absorption_timer > 0
-        ]
+        # Move all photons that are still in flight
+        self._update_moving(alive[state == _MOVING], speed)
+
+        # Drop photons that finished this step so later frames skip them
+        state = self.photons.state[alive]
+        self._alive = alive[state < _REFLECTED]
 
         # Update currently moving count
-        self.stats.currently_moving = sum(
-            1 for p in self.photons if p.state == PhotonState.MOVING
-        )
+        self.stats.currently_moving = int(np.count_nonzero(state == _MOVING))
+
+    def _alive_indices(self) -> np.ndarray:
+        """Indices of launched photons that have not finished, including new launches"""
+        if self._alive_end < self.launch_counter:
+            self._alive = np.concatenate(
+                (self._alive, np.arange(self._alive_end, self.launch_counter))
+            )
+            self._alive_end = self.launch_counter
+        return self._alive
 
     def _launch_photon(self):
         """Launch a new photon from TOA"""
+        self._launch_photons(1)
+
+    def _launch_photons(self, count: int):
+        """Launch the next count photons from TOA in one batch"""
+        start = self.launch_counter
         # Spread photons across scene width
-        x_pos = (self.launch_counter / max(self.num_photons - 1, 1)) * self.scene_width
-
-        photon = AnimatedPhoton(
-            tau=0.0,
-            direction=Direction.DOWN,
-            weight=1.0,
-            state=PhotonState.MOVING,
-            x_position=x_pos,
-        )
+        self.photons.x_position[start : start + count] = (
+            np.arange(start, start + count) / max(self.num_photons - 1, 1)
+        ) * self.scene_width
 
-        self.photons.append(photon)
-        self.launch_counter += 1
-        self.stats.total_launched += 1
-
-    def _update_photon(self, photon: AnimatedPhoton, speed: float):
-        """Update single photon state"""
-
-        # Handle special animation states
-        if photon.state == PhotonState.ABSORBING:
-            photon.absorption_timer -= 1
-            if photon.absorption_timer <= 0:
-                photon.state = PhotonState.ABSORBED
-                self.stats.absorbed += 1
-                # Record absorption depth at the true sampled interaction position
-                bin_idx = int(
-                    (photon.next_interaction_tau / self.tau_max)
-                    * len(self.stats.absorption_profile)
-                )
-                bin_idx = min(bin_idx, len(self.stats.absorption_profile) - 1)
-                self.stats.absorption_profile[bin_idx] += 1
+        self.launch_counter += count
+        self.stats.total_launched += count
+
+    def _update_absorbing(self, idx: np.ndarray):
+        """Count down absorption fades and record completed absorptions"""
+        if idx.size == 0:
             return
 
-        # Skip if already completed
-        if photon.state in [
-            PhotonState.REFLECTED,
-            PhotonState.TRANSMITTED,
-            PhotonState.ABSORBED,
-        ]:
+        photons = self.photons
+        photons.absorption_timer[idx] -= 1
+        done = idx[photons.absorption_timer[idx] <= 0]
+        if done.size == 0:
             return
 
-        # Move photon
-        delta_tau = speed * 0.01  # Convert pixels to optical depth units
-        photon.tau += photon.direction.value * delta_tau
+        photons.state[done] = _ABSORBED
+        self.stats.absorbed += done.size
+        # Record absorption depth at the true sampled interaction position
+        self._record_depths(
+            self.stats.absorption_profile, photons.next_interaction_tau[done]
+        )
 
-        # Check boundaries
-        if photon.tau <= 0.0:
-            photon.tau = 0.0
-            photon.state = PhotonState.REFLECTED
-            self.stats.reflected += 1
+    def _update_moving(self, idx: np.ndarray, speed: float):
+        """Move photons one step and resolve boundary crossings and interactions"""
+        if idx.size == 0:
             return
 
-        if photon.tau >= self.tau_max:
-            photon.tau = self.tau_max
-            # Check surface reflection
-            if np.random.random() < self.surface_albedo:
-                photon.direction = Direction.UP
-                photon.next_interaction_tau = photon.tau + Direction.UP.value * (
-                    -np.log(np.random.random())
-                )
+        photons = self.photons
+        tau_max = self._tau_max
+        direction = photons.direction[idx]
+
+        # Move photons
+        delta_tau = speed * 0.01  # Convert pixels to optical depth units
+        tau = photons.tau[idx] + direction * delta_tau
+
+        # Check boundaries
+        top = tau <= 0.0
+        bottom = ~top & (tau >= tau_max)
+
+        reflected = idx[top]
+        tau[top] = 0.0
+        photons.state[reflected] = _REFLECTED
+        self.stats.reflected += reflected.size
+
+        if bottom.any():
+            tau[bottom] = tau_max
+            at_surface = idx[bottom]
+            # Check surface reflection (black and perfectly white surfaces need no draw)
+            if self.surface_albedo <= 0.0:
+                bounce = np.zeros(at_surface.size, dtype=bool)
+            elif self.surface_albedo >= 1.0:
+                bounce = np.ones(at_surface.size, dtype=bool)
             else:
-                photon.state = PhotonState.TRANSMITTED
-                self.stats.transmitted += 1
-            return
+                bounce = self._rng.random(at_surface.size) < self.surface_albedo
+            bounced = at_surface[bounce]
+            photons.direction[bounced] = _UP
+            photons.next_interaction_tau[bounced] = (
+                tau_max + _UP * self._rng.standard_exponential(bounced.size)
+            )
+            transmitted = at_surface[~bounce]
+            photons.state[transmitted] = _TRANSMITTED
+            self.stats.transmitted += transmitted.size
+
+        photons.tau[idx] = tau
 
         # Check if reached interaction point
-        if (
-            photon.direction == Direction.DOWN
-            and photon.tau >= photon.next_interaction_tau
-        ) or (
-            photon.direction == Direction.UP
-            and photon.tau <= photon.next_interaction_tau
-        ):
+        next_tau = photons.next_interaction_tau[idx]
+        # Downward photons interact once tau >= next_tau, upward ones once it is
+        # below, so one boolean equality covers both directions
+        interacting = ~top & ~bottom & ((direction == _DOWN) == (tau >= next_tau))
+        if interacting.any():
             # Interaction!
-            self._process_interaction(photon)
-
-    def _process_interaction(self, photon: AnimatedPhoton):
-        """Process scattering or absorption event"""
+            self._process_interactions(idx[interacting])
 
-        # Get properties of layer at current position
-        layer = self.get_layer_at_tau(photon.tau)
-        if layer is None:
-            # Photon outside any layer - shouldn't happen but handle gracefully
-            return
+    def _process_interactions(self, idx: np.ndarray):
+        """Process scattering or absorption events for a batch of photons"""
+        photons = self.photons
+        tau = photons.tau[idx]
 
-        omega_0 = layer.omega_0
-        g = layer.g
+        # Get properties of layer at each photon position
+        layer_idx = np.minimum(
+            np.searchsorted(self._layer_bottoms, tau, side="left"),
+            len(self._layer_bottoms) - 1,
+        )
+        omega_0 = self._layer_omega_0[layer_idx]
+
+        # Decide: scatter or absorb? One uniform u decides both this and the
+        # scatter direction: u < omega_0 * (1 + g) / 2 is forward scatter,
+        # u < omega_0 backward scatter, anything else absorption
+        if self._pure_absorption:
+            u = None
+            scatter = np.zeros(idx.size, dtype=bool)
+        else:
+            u = self._rng.random(idx.size)
+            scatter = u < omega_0
 
-        # Decide: scatter or absorb?
-        if np.random.random() < omega_0:
+        scattered = idx[scatter]
+        if scattered.size:
             # Scattering event - no animation delay, just instant direction change
             # Record scattering event location at the true sampled interaction position
-            self.stats.total_scatters += 1
-            bin_idx = int(
-                (photon.next_interaction_tau / self.tau_max)
-                * len(self.stats.scattering_profile)
+            self.stats.total_scatters += scattered.size
+            self._record_depths(
+                self.stats.scattering_profile,
+                photons.next_interaction_tau[scattered],
             )
-            bin_idx = min(bin_idx, len(self.stats.scattering_profile) - 1)
-            self.stats.scattering_profile[bin_idx] += 1
-
-            # Henyey-Greenstein scattering in 2-stream
-            # P(forward) = (1 + g) / 2, P(backward) = (1 - g) / 2
-            p_forward = (1 + g) / 2
 
-            if np.random.random() < p_forward:
-                # Forward scatter: maintain current direction
-                pass
-            else:
-                # Backward scatter: reverse direction
-                photon.direction = (
-                    Direction.UP
-                    if photon.direction == Direction.DOWN
-                    else Direction.DOWN
-                )
+            # Backward scatter: reverse direction (masked negate, no per-photon branch)
+            direction = photons.direction[scattered]
+            backward = u[scatter] >= self._layer_forward_threshold[layer_idx[scatter]]
+            np.negative(direction, out=direction, where=backward)
+            photons.direction[scattered] = direction
 
             # Sample next interaction and continue moving
-            photon.next_interaction_tau = photon.tau + photon.direction.value * (
-                -np.log(np.random.random())
+            free_path = self._rng.standard_exponential(scattered.size)
+            photons.next_interaction_tau[scattered] = (
+                tau[scatter] + direction * free_path
             )
-            photon.state = PhotonState.MOVING
-        else:
-            # Absorption event
-            photon.state = PhotonState.ABSORBING
-            photon.absorption_timer = 15  # Fade for 15 frames
+            photons.state[scattered] = _MOVING
 
-        # Check weight threshold
-        photon.weight *= omega_0
-        if photon.weight < self.weight_threshold:
-            photon.state = PhotonState.ABSORBING
-            photon.absorption_timer = 15
+        # Absorption event
+        absorbed = idx[~scatter]
+        photons.state[absorbed] = _ABSORBING
+        photons.absorption_timer[absorbed] = ABSORPTION_FADE_DURATION
+
+        # Check weight threshold (weights never decay when omega_0 = 1 everywhere)
+        if self._conservative:
+            return
+        photons.weight[idx] *= omega_0
+        faded = idx[photons.weight[idx] < self.weight_threshold]
+        photons.state[faded] = _ABSORBING
+        photons.absorption_timer[faded] = ABSORPTION_FADE_DURATION
+
+    def _record_depths(self, profile: np.ndarray, taus: np.ndarray):
+        """Add a batch of event depths to a depth-binned profile"""
+        num_bins = profile.size
+        bin_idx = np.clip(
+            (taus * (self._inv_tau_max * num_bins)).astype(int), 0, num_bins - 1
+        )
+        profile += np.bincount(bin_idx, minlength=num_bins)
 
     def is_complete(self) -> bool:
         """Check if simulation is complete"""
         return self.stats.completed >= self.num_photons
 
-    def get_active_photons(self) -> List[AnimatedPhoton]:
-        """Get all photons for rendering"""
-        return self.photons
+    def _active_indices(self) -> np.ndarray:
+        """Indices of photons that are still visible (moving or fading out)"""
+        alive = self._alive_indices()
+        # Moving, scattering and absorbing all sort before the finished states
+        return alive[self.photons.state[alive] < _REFLECTED]
+
+    def get_active_arrays(self) -> PhotonArrays:
+        """Get photons that are still visible (moving or fading out) for rendering"""
+        return self.photons.take(self._active_indices())
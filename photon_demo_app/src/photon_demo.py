@@ -16,6 +16,12 @@ import numpy as np
 from config import *
 from photon_animation import PhotonSimulation, PhotonState, Direction, AtmosphericLayer
 
+# Photon sprite layout: fade steps 0..ABSORPTION_FADE_DURATION, then these kinds
+_SPRITE_SCATTER = ABSORPTION_FADE_DURATION + 1
+_SPRITE_DOWN = ABSORPTION_FADE_DURATION + 2
+_SPRITE_UP = ABSORPTION_FADE_DURATION + 3
+_SPRITE_HALF = PHOTON_RADIUS + 3  # Covers the scatter flash and arrow heads
+
 
 class FinalPhotonDemo:
     """Complete photon demo with full 2-stream RT physics"""
@@ -37,7 +43,7 @@ class FinalPhotonDemo:
                 omega_0=DEFAULT_OMEGA_0,
                 g=DEFAULT_G,
                 preset_name="Custom",
-                color=LAYER_PRESETS["Custom"]["color"],
+                color=LAYER_PRESETS["Custom"].color,
             )
         ]
         self.current_layer_index = 0  # Which layer is being edited
@@ -61,12 +67,36 @@ class FinalPhotonDemo:
         self.font_large = pygame.font.Font(None, 32)
         self.font_medium = pygame.font.Font(None, 24)
         self.font_small = pygame.font.Font(None, 18)
+        self.font_info = pygame.font.Font(None, INFO_FONT_SIZE)
+        self.font_info_bold = pygame.font.Font(None, INFO_FONT_SIZE)
+        self.font_info_bold.set_bold(True)
 
         # Create UI
         self._create_ui()
 
         self.sim_running = False
 
+        # Simulation steps owed at the nominal FPS, so speed does not follow render load
+        self._step_accum = 0.0
+
+        # Tick of the last layer slider change not yet applied to the simulation
+        self._pending_layer_update = None
+
+        # Cached static scene background and the layer state it was drawn for
+        self._background = None
+        self._background_key = None
+
+        # Rendered line plots keyed by title, with the data they were drawn from
+        self._plot_cache = {}
+
+        # Rendered text surfaces keyed by (font, text, color), least recently used evicted first
+        self._text_cache = {}
+
+        self._photon_sprites = self._build_photon_sprites()
+
+        # Set whenever something on screen may have changed since the last flip
+        self.dirty = True
+
     def _create_ui(self):
         """Create multi-layer control panel with simplified layout"""
         px = SCENE_WIDTH + 20
@@ -257,7 +287,7 @@ class FinalPhotonDemo:
             text="Parallel",
             manager=self.ui_manager,
         )
-        y += 45
+        y += 40
 
         # ========== Control Buttons ==========
         self.start_button = pygame_gui.elements.UIButton(
@@ -272,14 +302,11 @@ class FinalPhotonDemo:
             text="Reset",
             manager=self.ui_manager,
         )
-        y += 50
+        y += 45
 
         # ========== Info box ==========
-        self.info_box = pygame_gui.elements.UITextBox(
-            html_text=self._get_info_html(),
-            relative_rect=pygame.Rect(px, y, w, WINDOW_HEIGHT - y - 20),
-            manager=self.ui_manager,
-        )
+        # Drawn by _draw_info_panel from cached text surfaces
+        self.info_rect = pygame.Rect(px, y, w, WINDOW_HEIGHT - y - 20)
 
         # Set initial button states
         self._update_mode_buttons()
@@ -351,11 +378,11 @@ class FinalPhotonDemo:
         current_layer = self.layers[self.current_layer_index]
 
         # Update layer properties from preset
-        current_layer.tau_thickness = preset["tau_thickness"]
-        current_layer.omega_0 = preset["omega_0"]
-        current_layer.g = preset["g"]
+        current_layer.tau_thickness = preset.tau_thickness
+        current_layer.omega_0 = preset.omega_0
+        current_layer.g = preset.g
         current_layer.preset_name = preset_name
-        current_layer.color = preset["color"]
+        current_layer.color = preset.color
 
         # Recalculate layer boundaries
         self.simulation._update_layer_boundaries()
@@ -374,7 +401,7 @@ class FinalPhotonDemo:
             omega_0=DEFAULT_OMEGA_0,
             g=DEFAULT_G,
             preset_name="Custom",
-            color=LAYER_PRESETS["Custom"]["color"],
+            color=LAYER_PRESETS["Custom"].color,
         )
 
         self.layers.append(new_layer)
@@ -437,47 +464,66 @@ class FinalPhotonDemo:
         self._update_layer_controls()
         self._update_layer_buttons()
 
-    def _get_info_html(self):
-        """Info text"""
+    def _get_info_segments(self):
+        """Info text as rows of (segment, bold) pairs laid out left to right"""
         stats = self.simulation.stats
+        mode = (self.mode.upper(), True)
 
         if stats.total_launched == 0:
-            return f"""
-            <b>Mode: {self.mode.upper()}</b><br>
-            <br>
-            Click Start to begin
-            """
-
-        return f"""
-        <b>Mode: {self.mode.upper()}</b><br>
-        <br>
-        Launched: {stats.total_launched}<br>
-        Active: {stats.currently_moving}<br>
-        Scatters: {stats.total_scatters}<br>
-        <br>
-        <b>Energy Budget:</b><br>
-        R: {stats.reflectance:.1%}<br>
-        T: {stats.transmittance:.1%}<br>
-        A: {stats.absorptance:.1%}<br>
-        Σ: {(stats.reflectance + stats.transmittance + stats.absorptance):.1%}
-        """
+            return [[mode, ("Click Start to begin", False)]]
+
+        return [
+            [
+                mode,
+                (f"Launched {stats.total_launched}", False),
+                (f"Scatters {stats.total_scatters}", False),
+            ],
+            [
+                (f"R {stats.reflectance:.1%}", False),
+                (f"T {stats.transmittance:.1%}", False),
+                (f"A {stats.absorptance:.1%}", False),
+            ],
+        ]
 
-    def _update_labels(self):
-        """Update labels for current layer and global parameters"""
+    def _update_labels(self, slider=None):
+        """Update labels for current layer and global parameters
+
+        Args:
+            slider: Only refresh the label of this slider (all labels if None)
+        """
         current_layer = self.layers[self.current_layer_index]
 
-        self.tau_thickness_label.set_text(
-            f"Optical Depth (τ): {current_layer.tau_thickness:.1f}"
-        )
-        self.omega_label.set_text(f"SSA (ω₀): {current_layer.omega_0:.2f}")
-        self.g_label.set_text(f"Asymmetry (g): {current_layer.g:.2f}")
-        self.albedo_label.set_text(f"Surface Albedo: {self.surface_albedo:.2f}")
-        self.nphotons_label.set_text(f"Photons: {int(self.num_photons)}")
-        self.speed_label.set_text(f"Animation Speed: {self.animation_speed:.1f}x")
+        if slider in (None, self.tau_thickness_slider):
+            self.tau_thickness_label.set_text(
+                f"Optical Depth (τ): {current_layer.tau_thickness:.1f}"
+            )
+        if slider in (None, self.omega_slider):
+            self.omega_label.set_text(f"SSA (ω₀): {current_layer.omega_0:.2f}")
+        if slider in (None, self.g_slider):
+            self.g_label.set_text(f"Asymmetry (g): {current_layer.g:.2f}")
+        if slider in (None, self.albedo_slider):
+            self.albedo_label.set_text(f"Surface Albedo: {self.surface_albedo:.2f}")
+        if slider in (None, self.nphotons_slider):
+            self.nphotons_label.set_text(f"Photons: {int(self.num_photons)}")
+        if slider in (None, self.speed_slider):
+            self.speed_label.set_text(f"Animation Speed: {self.animation_speed:.1f}x")
+
+    def _text(self, font, text, color):
+        """Render text through the surface cache"""
+        key = (id(font), text, color)
+        surface = self._text_cache.pop(key, None)
+        if surface is None:
+            if len(self._text_cache) >= TEXT_CACHE_SIZE:
+                del self._text_cache[next(iter(self._text_cache))]
+            surface = font.render(text, True, color)
+        # Reinsert so the dict stays ordered from least to most recently used
+        self._text_cache[key] = surface
+        return surface
 
     def _draw_scene(self):
         """Draw main visualization"""
-        self.screen.fill(COLOR_BG)
+        # Static background (layers, boundaries, TOA/surface, panel) is cached
+        self.screen.blit(self._get_scene_background(), (0, 0))
 
         # Draw animation area (left side, full height)
         self._draw_animation_area()
@@ -491,14 +537,33 @@ class FinalPhotonDemo:
         # Draw counters (bottom)
         self._draw_counters()
 
-    def _draw_animation_area(self):
-        """Draw photon animation with layer boundaries"""
+    def _get_scene_background(self) -> pygame.Surface:
+        """Return the static window background, re-rendering it if the layers changed"""
+        key = (
+            self.surface_albedo,
+            tuple((l.tau_top, l.tau_bottom, l.color) for l in self.layers),
+        )
+        if key != self._background_key:
+            self._background = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+            self._draw_atmosphere(self._background)
+            self._draw_panel(self._background)
+            self._background_key = key
+        return self._background
+
+    def _draw_atmosphere(self, surface: pygame.Surface):
+        """Draw layers and boundaries onto surface
+
+        Args:
+            surface: Target surface, covering at least the scene area
+        """
         x = ANIM_MARGIN
         y = ANIM_MARGIN
         w = ANIM_WIDTH
         h = ANIM_HEIGHT
         tau_max = self.simulation.tau_max
 
+        surface.fill(COLOR_BG)
+
         # Draw each layer with its specific color
         for layer in self.layers:
             layer_y_top = y + (layer.tau_top / tau_max) * h
@@ -508,7 +573,7 @@ class FinalPhotonDemo:
             # Draw layer background with its color
             s = pygame.Surface((w, int(layer_height)), pygame.SRCALPHA)
             s.fill(layer.color)
-            self.screen.blit(s, (x, int(layer_y_top)))
+            surface.blit(s, (x, int(layer_y_top)))
 
         # Draw layer boundaries (except TOA and surface which are drawn separately)
         for i, layer in enumerate(self.layers):
@@ -521,7 +586,7 @@ class FinalPhotonDemo:
                 while current_x < x + w:
                     end_x = min(current_x + dash_length, x + w)
                     pygame.draw.line(
-                        self.screen,
+                        surface,
                         (100, 100, 100),
                         (int(current_x), int(boundary_y)),
                         (int(end_x), int(boundary_y)),
@@ -532,90 +597,100 @@ class FinalPhotonDemo:
                 boundary_text = self.font_small.render(
                     f"τ = {layer.tau_top:.1f}", True, (30, 30, 30)
                 )
-                self.screen.blit(boundary_text, (x + w - 60, int(boundary_y) - 15))
+                surface.blit(boundary_text, (x + w - 60, int(boundary_y) - 15))
 
         # TOA (top boundary)
-        pygame.draw.line(self.screen, COLOR_TOA, (x, y), (x + w, y), 3)
+        pygame.draw.line(surface, COLOR_TOA, (x, y), (x + w, y), 3)
         text = self.font_medium.render("τ = 0 (TOA)", True, COLOR_TOA)
-        self.screen.blit(text, (x + 10, y - 30))
+        surface.blit(text, (x + 10, y - 30))
 
         # Surface (bottom boundary)
         surf_y = y + h
-        pygame.draw.line(self.screen, COLOR_SURFACE, (x, surf_y), (x + w, surf_y), 3)
+        pygame.draw.line(surface, COLOR_SURFACE, (x, surf_y), (x + w, surf_y), 3)
         text = self.font_medium.render(
             f"τ = {tau_max:.1f} (Surface, Albedo = {self.surface_albedo:.2f})",
             True,
             COLOR_SURFACE,
         )
-        self.screen.blit(text, (x + 10, surf_y + 5))
-
-        # Draw photons
-        for photon in self.simulation.get_active_photons():
-            py = y + (photon.tau / self.simulation.tau_max) * h
-            px = x + photon.x_position
-
-            if photon.state == PhotonState.SCATTERING:
-                color = COLOR_SCATTER_EVENT
-                radius = PHOTON_RADIUS + 2
-            elif photon.state == PhotonState.ABSORBING:
-                alpha = int(255 * (photon.absorption_timer / 15))
-                color = (*COLOR_PHOTON_ABSORBED, alpha)
-                radius = PHOTON_RADIUS
-            elif photon.state == PhotonState.MOVING:
-                color = (
-                    COLOR_PHOTON_DOWN
-                    if photon.direction == Direction.DOWN
-                    else COLOR_PHOTON_UP
-                )
-                radius = PHOTON_RADIUS
-            else:
-                continue
-
-            # Draw photon
-            if len(color) == 4:
-                surf = pygame.Surface((radius * 2 + 2, radius * 2 + 2), pygame.SRCALPHA)
-                pygame.draw.circle(surf, color, (radius + 1, radius + 1), radius)
-                self.screen.blit(surf, (int(px) - radius - 1, int(py) - radius - 1))
-            else:
-                pygame.draw.circle(self.screen, color, (int(px), int(py)), radius)
-
-            # Arrow
-            if photon.state == PhotonState.MOVING:
-                anim_len = 6
-                if photon.direction == Direction.DOWN:
-                    pygame.draw.line(
-                        self.screen,
-                        (255, 255, 255),
-                        (int(px), int(py) - anim_len // 2),
-                        (int(px), int(py) + anim_len // 2),
-                        1,
-                    )
-                    pygame.draw.polygon(
-                        self.screen,
-                        (255, 255, 255),
-                        [
-                            (int(px), int(py) + anim_len // 2 + 2),
-                            (int(px) - 2, int(py) + anim_len // 2 - 1),
-                            (int(px) + 2, int(py) + anim_len // 2 - 1),
-                        ],
-                    )
-                else:
-                    pygame.draw.line(
-                        self.screen,
-                        (255, 255, 255),
-                        (int(px), int(py) - anim_len // 2),
-                        (int(px), int(py) + anim_len // 2),
-                        1,
-                    )
-                    pygame.draw.polygon(
-                        self.screen,
-                        (255, 255, 255),
-                        [
-                            (int(px), int(py) - anim_len // 2 - 2),
-                            (int(px) - 2, int(py) - anim_len // 2 + 1),
-                            (int(px) + 2, int(py) - anim_len // 2 + 1),
-                        ],
-                    )
+        surface.blit(text, (x + 10, surf_y + 5))
+
+    def _draw_animation_area(self):
+        """Draw photons over the cached atmosphere background"""
+        x = ANIM_MARGIN
+        y = ANIM_MARGIN
+        h = ANIM_HEIGHT
+
+        # Screen coordinates for all visible photons in one vectorized pass
+        photons = self.simulation.get_active_arrays()
+        pys = (y + photons.tau * (h / self.simulation.tau_max)).astype(int)
+        pxs = (x + photons.x_position).astype(int)
+
+        # One pre-rendered sprite per photon appearance, all drawn in one blits call
+        states = photons.state
+        kinds = np.where(photons.direction == Direction.DOWN, _SPRITE_DOWN, _SPRITE_UP)
+        kinds[states == PhotonState.SCATTERING] = _SPRITE_SCATTER
+        absorbing = states == PhotonState.ABSORBING
+        kinds[absorbing] = np.clip(
+            photons.absorption_timer[absorbing], 0, ABSORPTION_FADE_DURATION
+        )
+
+        sprites = self._photon_sprites
+        half = _SPRITE_HALF
+        self.screen.blits(
+            [
+                (sprites[kind], (px - half, py - half))
+                for kind, px, py in zip(kinds.tolist(), pxs.tolist(), pys.tolist())
+            ],
+            doreturn=False,
+        )
+
+    def _build_photon_sprites(self):
+        """Pre-render photon sprites, indexed by fade timer then _SPRITE_* kinds"""
+        size = 2 * _SPRITE_HALF + 1
+        c = _SPRITE_HALF
+
+        def sprite():
+            return pygame.Surface((size, size), pygame.SRCALPHA).convert_alpha()
+
+        # Absorbing photons fade out over the absorption timer
+        sprites = []
+        for timer in range(ABSORPTION_FADE_DURATION + 1):
+            alpha = int(255 * (timer / ABSORPTION_FADE_DURATION))
+            surf = sprite()
+            pygame.draw.circle(
+                surf, (*COLOR_PHOTON_ABSORBED, alpha), (c, c), PHOTON_RADIUS
+            )
+            sprites.append(surf)
+
+        # Scattering flash
+        surf = sprite()
+        pygame.draw.circle(surf, COLOR_SCATTER_EVENT, (c, c), PHOTON_RADIUS + 2)
+        sprites.append(surf)
+
+        # Moving photons with a direction arrow
+        anim_len = 6
+        for color, sign in ((COLOR_PHOTON_DOWN, 1), (COLOR_PHOTON_UP, -1)):
+            surf = sprite()
+            pygame.draw.circle(surf, color, (c, c), PHOTON_RADIUS)
+            pygame.draw.line(
+                surf,
+                (255, 255, 255),
+                (c, c - anim_len // 2),
+                (c, c + anim_len // 2),
+                1,
+            )
+            pygame.draw.polygon(
+                surf,
+                (255, 255, 255),
+                [
+                    (c, c + sign * (anim_len // 2 + 2)),
+                    (c - 2, c + sign * (anim_len // 2 - 1)),
+                    (c + 2, c + sign * (anim_len // 2 - 1)),
+                ],
+            )
+            sprites.append(surf)
+
+        return sprites
 
     def _draw_profile_plots(self):
         """Draw scattering and absorption line plots side-by-side"""
@@ -646,51 +721,74 @@ class FinalPhotonDemo:
         )
 
     def _draw_line_plot(self, x, y, width, height, data, color, title, ylabel):
-        """Draw a line plot with axes"""
+        """Draw a line plot with axes, re-rendering it only when data changes"""
+        key = data.tobytes()
+        cached = self._plot_cache.get(title)
+        if cached is None or cached[0] != key:
+            surface = self._render_line_plot(width, height, data, color, title)
+            cached = self._plot_cache[title] = (key, surface)
+        self.screen.blit(cached[1], (x, y - PLOT_TITLE_SPACE))
+
+    def _render_line_plot(self, width, height, data, color, title):
+        """Render a line plot, its title and max label onto a new surface
+
+        Args:
+            width: Plot frame width
+            height: Plot frame height
+            data: Counts per depth bin
+            color: Line and marker color
+            title: Title drawn above the frame
+        """
+        surface = pygame.Surface(
+            (width, height + PLOT_TITLE_SPACE + PLOT_LABEL_SPACE)
+        ).convert()
+        surface.fill(COLOR_BG)
+        x = 0
+        y = PLOT_TITLE_SPACE
+
         # Background
-        pygame.draw.rect(self.screen, (255, 255, 255), (x, y, width, height))
-        pygame.draw.rect(self.screen, (200, 200, 200), (x, y, width, height), 2)
+        pygame.draw.rect(surface, (255, 255, 255), (x, y, width, height))
+        pygame.draw.rect(surface, (200, 200, 200), (x, y, width, height), 2)
 
         # Title
-        text = self.font_medium.render(title, True, (50, 50, 50))
+        text = self._text(self.font_medium, title, (50, 50, 50))
         text_rect = text.get_rect(center=(x + width // 2, y - 20))
-        self.screen.blit(text, text_rect)
+        surface.blit(text, text_rect)
 
-        if sum(data) == 0:
+        if not data.any():
             # No data
-            no_data = self.font_small.render("No data yet", True, (100, 100, 100))
+            no_data = self._text(self.font_small, "No data yet", (100, 100, 100))
             text_rect = no_data.get_rect(center=(x + width // 2, y + height // 2))
-            self.screen.blit(no_data, text_rect)
-            return
+            surface.blit(no_data, text_rect)
+            return surface
 
         # Plot data
-        max_val = max(data) if data else 1
+        max_val = data.max()
         bin_height = height / len(data)
 
         # Draw line
-        points = []
-        for i, count in enumerate(data):
-            plot_y = y + i * bin_height + bin_height / 2
-            plot_x = x + (count / max_val) * (width - 40) + 20
-            points.append((plot_x, plot_y))
+        plot_ys = y + np.arange(len(data)) * bin_height + bin_height / 2
+        plot_xs = x + (data / max_val) * (width - 40) + 20
+        points = np.column_stack((plot_xs, plot_ys))
 
         if len(points) > 1:
-            pygame.draw.lines(self.screen, color, False, points, 2)
+            pygame.draw.lines(surface, color, False, points.tolist(), 2)
 
         # Draw points
-        for pt in points:
-            pygame.draw.circle(self.screen, color, (int(pt[0]), int(pt[1])), 3)
+        for pt in points.astype(int).tolist():
+            pygame.draw.circle(surface, color, pt, 3)
 
         # # Y-axis label (depth)
         # depth_labels = [0, self.simulation.tau_max / 2, self.simulation.tau_max]
         # for i, depth in enumerate(depth_labels):
         #     label_y = y + i * (height / 2)
         #     text = self.font_small.render(f"τ={depth:.1f}", True, (100, 100, 100))
-        #     self.screen.blit(text, (x - 35, label_y - 8))
+        #     surface.blit(text, (x - 35, label_y - 8))
 
         # X-axis label (max value)
-        max_text = self.font_small.render(f"max: {max(data)}", True, (30, 30, 30))
-        self.screen.blit(max_text, (x + width - 60, y + height + 5))
+        max_text = self._text(self.font_small, f"max: {max_val}", (30, 30, 30))
+        surface.blit(max_text, (x + width - 60, y + height + 5))
+        return surface
 
     def _draw_flux_displays(self):
         """Draw incident, reflected, and transmitted flux values"""
@@ -732,17 +830,17 @@ class FinalPhotonDemo:
     def _draw_flux_value(self, x, y, flux, label, color):
         """Draw a single flux value with label"""
         # Value
-        flux_text = self.font_flux.render(f"{flux:.0f}", True, color)
+        flux_text = self._text(self.font_flux, f"{flux:.0f}", color)
         flux_rect = flux_text.get_rect(center=(x, y))
         self.screen.blit(flux_text, flux_rect)
 
         # Label
-        label_text = self.font_small.render(label, True, (30, 30, 30))
+        label_text = self._text(self.font_small, label, (30, 30, 30))
         label_rect = label_text.get_rect(center=(x, y + 30))
         self.screen.blit(label_text, label_rect)
 
         # Units
-        units_text = self.font_small.render("W/m²", True, (50, 50, 50))
+        units_text = self._text(self.font_small, "W/m²", (50, 50, 50))
         units_rect = units_text.get_rect(center=(x, y + 48))
         self.screen.blit(units_text, units_rect)
 
@@ -770,32 +868,59 @@ class FinalPhotonDemo:
 
     def _draw_counter(self, x, y, value, label, color):
         """Draw counter"""
-        val_text = self.font_huge.render(str(value), True, color)
+        val_text = self._text(self.font_huge, str(value), color)
         val_rect = val_text.get_rect(center=(x, y - 10))
         self.screen.blit(val_text, val_rect)
 
-        lab_text = self.font_small.render(label, True, (30, 30, 30))
+        lab_text = self._text(self.font_small, label, (30, 30, 30))
         lab_rect = lab_text.get_rect(center=(x, y + 25))
         self.screen.blit(lab_text, lab_rect)
 
-    def _draw_panel(self):
-        """Draw control panel"""
+    def _draw_panel(self, surface: pygame.Surface):
+        """Draw control panel background and info box frame onto surface
+
+        Args:
+            surface: Target surface, covering the window
+        """
         pygame.draw.rect(
-            self.screen, COLOR_PANEL, (SCENE_WIDTH, 0, PANEL_WIDTH, WINDOW_HEIGHT)
+            surface, COLOR_PANEL, (SCENE_WIDTH, 0, PANEL_WIDTH, WINDOW_HEIGHT)
         )
         pygame.draw.line(
-            self.screen,
+            surface,
             (200, 200, 200),
             (SCENE_WIDTH, 0),
             (SCENE_WIDTH, WINDOW_HEIGHT),
             2,
         )
+        pygame.draw.rect(surface, (200, 200, 200), self.info_rect, 1)
+
+    def _draw_info_panel(self):
+        """Draw mode, photon counts and energy budget into the info box"""
+        rect = self.info_rect
+        rows = self._get_info_segments()
+        line_height = self.font_info.get_linesize() + 2
+        top = rect.centery - line_height * len(rows) / 2
+
+        self.screen.set_clip(rect.inflate(-2, -2))
+        for i, row in enumerate(rows):
+            x = rect.x + 8
+            y = top + line_height * (i + 0.5)
+            for segment, bold in row:
+                font = self.font_info_bold if bold else self.font_info
+                text = self._text(font, segment, (30, 30, 30))
+                self.screen.blit(text, text.get_rect(midleft=(x, y)))
+                x += text.get_width() + INFO_SEGMENT_GAP
+        self.screen.set_clip(None)
 
     def _handle_events(self):
         """Handle events"""
         time_delta = self.clock.tick(FPS) / 1000.0
+        self._step_accum += time_delta * FPS
 
         for event in pygame.event.get():
+            # Any event can change the UI (hover, sliders, buttons, dropdowns)
+            self.dirty = True
+
             if event.type == pygame.QUIT:
                 self.running = False
 
@@ -805,14 +930,16 @@ class FinalPhotonDemo:
                 if event.ui_element == self.tau_thickness_slider:
                     current_layer.tau_thickness = event.value
                     current_layer.preset_name = "Custom"  # Mark as custom
-                    # Recalculate layer boundaries
-                    self.simulation._update_layer_boundaries()
+                    # Recalculate layer boundaries once the slider settles
+                    self._pending_layer_update = pygame.time.get_ticks()
                 elif event.ui_element == self.omega_slider:
                     current_layer.omega_0 = event.value
                     current_layer.preset_name = "Custom"  # Mark as custom
+                    self._pending_layer_update = pygame.time.get_ticks()
                 elif event.ui_element == self.g_slider:
                     current_layer.g = event.value
                     current_layer.preset_name = "Custom"  # Mark as custom
+                    self._pending_layer_update = pygame.time.get_ticks()
                 elif event.ui_element == self.albedo_slider:
                     self.surface_albedo = event.value
                 elif event.ui_element == self.nphotons_slider:
@@ -820,7 +947,7 @@ class FinalPhotonDemo:
                 elif event.ui_element == self.speed_slider:
                     self.animation_speed = event.value
 
-                self._update_labels()
+                self._update_labels(event.ui_element)
 
             elif event.type == pygame_gui.UI_BUTTON_PRESSED:
                 if event.ui_element == self.start_button:
@@ -848,6 +975,19 @@ class FinalPhotonDemo:
 
         self.ui_manager.update(time_delta)
 
+    def _apply_pending_layer_update(self):
+        """Apply debounced layer slider changes once the slider is idle"""
+        if self._pending_layer_update is None:
+            return
+        if pygame.time.get_ticks() - self._pending_layer_update < SLIDER_DEBOUNCE_MS:
+            return
+
+        self._pending_layer_update = None
+        # Recalculate layer boundaries and property tables
+        self.simulation._update_layer_boundaries()
+        # Layer bands and labels change even when no event or step follows
+        self.dirty = True
+
     def _start_simulation(self):
         """Start simulation with current multi-layer configuration"""
         self.simulation.reset(
@@ -857,6 +997,7 @@ class FinalPhotonDemo:
             mode=self.mode,
         )
         self.sim_running = True
+        self._step_accum = 0.0
         self.start_button.set_text("Running...")
         self.start_button.disable()
 
@@ -871,21 +1012,20 @@ class FinalPhotonDemo:
         self.sim_running = False
         self.start_button.set_text("Start Animation")
         self.start_button.enable()
-        self.info_box.html_text = self._get_info_html()
-        self.info_box.rebuild()
 
     def run(self):
         """Main loop"""
         while self.running:
             self._handle_events()
+            self._apply_pending_layer_update()
 
             if self.sim_running:
-                self.simulation.update(self.animation_speed)
-
-                # Update info periodically
-                if pygame.time.get_ticks() % 500 < 20:
-                    self.info_box.html_text = self._get_info_html()
-                    self.info_box.rebuild()
+                # At least one step per frame; only overrun frames catch up
+                steps = min(max(int(self._step_accum), 1), MAX_STEPS_PER_FRAME)
+                self._step_accum = min(max(self._step_accum - steps, 0.0), 1.0)
+                for _ in range(steps):
+                    self.simulation.update(self.animation_speed)
+                self.dirty = True
 
                 # Check completion
                 if (
@@ -896,12 +1036,14 @@ class FinalPhotonDemo:
                     self.start_button.set_text("Start Animation")
                     self.start_button.enable()
 
-            # Draw
-            self._draw_scene()
-            self._draw_panel()
-            self.ui_manager.draw_ui(self.screen)
+            # Draw only when something changed; an idle screen stays as flipped
+            if self.dirty:
+                self._draw_scene()
+                self._draw_info_panel()
+                self.ui_manager.draw_ui(self.screen)
 
-            pygame.display.flip()
+                pygame.display.flip()
+                self.dirty = False
 
         pygame.quit()
 